@@ -2,6 +2,10 @@ import json
 import logging
 import time
 import os
+import threading
+
+from array import array
+from collections import OrderedDict
 
 import tiktoken
 
@@ -41,6 +45,17 @@ from src.util.prompt_optimizer import PromptOptimizer
 class AiService:
     """Constructor method; call initialize() immediately after this."""
 
+    # AzureOpenAI clients shared by all instances in the process, keyed by
+    # (endpoint, key, version), so that their HTTP connection pools are reused
+    shared_aoai_clients = dict()
+
+    # LRU cache of embedding vectors keyed by (deployment, text), so that
+    # repeated user text doesn't incur another Azure OpenAI round-trip.
+    # The vectors are stored as compact array('d') values, about 12KB each.
+    embeddings_cache = OrderedDict()
+    embeddings_cache_max_size = 512
+    embeddings_cache_lock = threading.Lock()
+
     def __init__(self, opts={}):
         """
         Get the necessary environment variables and initialze an AzureOpenAI client.
@@ -59,10 +74,8 @@ class AiService:
             self.enc = tiktoken.get_encoding("cl100k_base")
             self.nosql_svc = CosmosNoSQLService()
 
-            self.aoai_client = AzureOpenAI(
-                azure_endpoint=self.aoai_endpoint,
-                api_key=self.aoai_api_key,
-                api_version=self.aoai_version,
+            self.aoai_client = AiService.shared_aoai_client(
+                self.aoai_endpoint, self.aoai_api_key, self.aoai_version
             )
             self.completions_deployment = (
                 # deployment name/model = gpt4/gpt-4
@@ -110,6 +123,21 @@ class AiService:
         logging.info("AiService#initialize()")
         await self.nosql_svc.initialize()
 
+    @classmethod
+    def shared_aoai_client(cls, endpoint, api_key, version) -> AzureOpenAI:
+        """
+        Return the process-wide AzureOpenAI client for the given endpoint,
+        key and version, creating it on first use.
+        """
+        client_key = (endpoint, api_key, version)
+        if client_key not in cls.shared_aoai_clients:
+            cls.shared_aoai_clients[client_key] = AzureOpenAI(
+                azure_endpoint=endpoint,
+                api_key=api_key,
+                api_version=version,
+            )
+        return cls.shared_aoai_clients[client_key]
+
     def num_tokens_from_string(self, s: str) -> int:
         try:
             return len(self.tiktoken_encoding.encode(s))
@@ -128,9 +156,7 @@ class AiService:
             raw_owl = resp_obj["owl"]
             #owl = OwlFormatter().minimize(raw_owl)
             logging.info(
-                "AiService#generate_sparql_from_user_prompt - user_prompt: {}".format(
-                    user_prompt
-                )
+                "AiService#generate_sparql_from_user_prompt - user_prompt: %s", user_prompt
             )
             if custom_rules:
                 logging.info(
@@ -162,17 +188,17 @@ class AiService:
                 )
                 t2 = time.perf_counter()
                 logging.info(
-                    "AiService#generate_sparql_from_user_prompt - Completion: {}".format(
-                        completion.choices[0].message.content
-                    )
+                    "AiService#generate_sparql_from_user_prompt - Completion: %s",
+                    completion.choices[0].message.content,
                 )
                 # completion is an instance of <class 'openai.types.chat.chat_completion.ChatCompletion'>
                 # https://platform.openai.com/docs/api-reference/chat/object
-                sparql = json.loads(completion.choices[0].message.content).get("sparql")
+                content_obj = json.loads(completion.choices[0].message.content)
+                sparql = content_obj.get("sparql")
                 if sparql is None:
-                    sparql = json.loads(completion.choices[0].message.content).get("query")
+                    sparql = content_obj.get("query")
                 if sparql is None:
-                    sparql = json.loads(completion.choices[0].message.content).get("SPARQL")
+                    sparql = content_obj.get("SPARQL")
                 resp_obj["completion_id"] = completion.id
                 resp_obj["completion_model"] = completion.model
                 resp_obj["prompt_tokens"] = completion.usage.prompt_tokens
@@ -183,9 +209,7 @@ class AiService:
                 if resp_obj["sparql"] == None:
                     resp_obj["sparql"] = ""
                 logging.info(
-                    "AiService#generate_sparql_from_user_prompt - sparql: {}".format(
-                        sparql
-                    )
+                    "AiService#generate_sparql_from_user_prompt - sparql: %s", sparql
                 )
             else:
                 resp_obj["error"] = "content moderation failed"
@@ -244,6 +268,27 @@ class AiService:
             logging.exception(e, stack_info=True, exc_info=True)
             return None
 
+    def generate_embedding_vector(self, text) -> list | None:
+        """
+        Return the embedding vector, a list of floats, for the given text
+        or None.  Vectors are cached per deployment and text; see
+        embeddings_cache.
+        """
+        cache_key = (self.embeddings_deployment, text)
+        with AiService.embeddings_cache_lock:
+            if cache_key in AiService.embeddings_cache:
+                AiService.embeddings_cache.move_to_end(cache_key)
+                return list(AiService.embeddings_cache[cache_key])
+        resp = self.generate_embeddings(text)
+        if resp is None:
+            return None
+        embedding = resp.data[0].embedding
+        with AiService.embeddings_cache_lock:
+            AiService.embeddings_cache[cache_key] = array("d", embedding)
+            while len(AiService.embeddings_cache) > AiService.embeddings_cache_max_size:
+                AiService.embeddings_cache.popitem(last=False)
+        return embedding
+
     def text_to_chunks(self, text):
         max_chunk_size = 2048
         chunks = []
@@ -528,6 +528,16 @@ class ConfigService:
         os.environ["SAMPLE_BOOLEAN_TRUE_VAR"] = "TRue"
         os.environ["SAMPLE_BOOLEAN_FALSE_VAR"] = "F"
 
+    @classmethod
+    def speculative_vector_fallback(cls) -> bool:
+        """
+        Return True if the vector search fallback should be started alongside
+        the db/graph retrieval rather than after it misses.  This trades an
+        extra embeddings call and vector search per hit for lower latency
+        per miss, so only enable it where the db/graph strategies miss often.
+        """
+        return cls.boolean_envvar("CAIG_SPECULATIVE_VECTOR_FALLBACK", False)
+
     @classmethod
     def get_strategy_bypass(cls) -> str:
         return cls.envvar("CAIG_STRATEGY_BYPASS", "false")
\ No newline at end of file
@@ -219,14 +219,20 @@ class CosmosNoSQLService:
     async def save_conversation(self, conv: AiConversation | None):
         resp = None
         if conv is not None:
-            logging.info(f"Saving conversation with completions: {conv.completions}")
+            # the per-completion logging loops only run when their level is enabled,
+            # and the payload logs use lazy %-style args; completions can be large
+            info_enabled = logging.getLogger().isEnabledFor(logging.INFO)
+            debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+            logging.info("Saving conversation with completions: %s", conv.completions)
             self.set_container(ConfigService.conversations_container())
 
             # Load existing conversation to merge completions
             existing_conv = await self.load_conversation(conv.conversation_id)
             if existing_conv:
                 logging.info("Merging completions with existing conversation.")
-                logging.info(f"BEFORE MERGE: incoming={len(conv.completions)}, existing={len(existing_conv.completions)}")
+                logging.info(
+                    "BEFORE MERGE: incoming=%s, existing=%s",
+                    len(conv.completions), len(existing_conv.completions))
                 
                 # Create a comprehensive list of all completions
                 all_completions = existing_conv.completions.copy()  # Start with existing
@@ -235,9 +241,12 @@ class CosmosNoSQLService:
                 existing_ids = {c.get("completion_id") for c in existing_conv.completions}
                 new_completions = [c for c in conv.completions if c.get("completion_id") not in existing_ids]
                 
-                logging.info(f"MERGE FILTERING: {len(new_completions)} new completions after dedup")
-                for i, c in enumerate(new_completions):
-                    logging.info(f"  New completion {i}: ID={c.get('completion_id')}, Index={c.get('index')}, User={c.get('user_text')}")
+                logging.info("MERGE FILTERING: %s new completions after dedup", len(new_completions))
+                if info_enabled:
+                    for i, c in enumerate(new_completions):
+                        logging.info(
+                            "  New completion %s: ID=%s, Index=%s, User=%s",
+                            i, c.get("completion_id"), c.get("index"), c.get("user_text"))
                 
                 # Append new completions to the existing list
                 all_completions.extend(new_completions)
@@ -248,52 +257,61 @@ class CosmosNoSQLService:
                 # Update the conversation's completions
                 conv.completions = all_completions
                 
-                logging.info(f"AFTER MERGE: total={len(conv.completions)} completions")
-                for i, c in enumerate(conv.completions):
-                    logging.info(f"  Final completion {i}: ID={c.get('completion_id')}, Index={c.get('index')}, User={c.get('user_text')}")
+                logging.info("AFTER MERGE: total=%s completions", len(conv.completions))
+                if info_enabled:
+                    for i, c in enumerate(conv.completions):
+                        logging.info(
+                            "  Final completion %s: ID=%s, Index=%s, User=%s",
+                            i, c.get("completion_id"), c.get("index"), c.get("user_text"))
 
                 # Debugging: Log the state of completions after merging
-                logging.debug("Completions after merging:")
-                for c in conv.completions:
-                    logging.debug(f"Completion ID: {c.get('completion_id')}, Index: {c.get('index')}")
+                if debug_enabled:
+                    logging.debug("Completions after merging:")
+                    for c in conv.completions:
+                        logging.debug(
+                            "Completion ID: %s, Index: %s",
+                            c.get("completion_id"), c.get("index"))
             else:
                 logging.info("No existing conversation found - saving new conversation.")
 
             # Debugging: Log completions before saving
-            logging.debug("Completions before saving:")
-            for c in conv.completions:
-                logging.debug(f"Completion ID: {c.get('completion_id')}, Index: {c.get('index')}, Content: {c.get('content')}")
-
-            # Debugging: Log completions after merging
-            logging.debug("Completions after merging:")
-            for c in conv.completions:
-                logging.debug(f"Completion ID: {c.get('completion_id')}, Index: {c.get('index')}, Content: {c.get('content')}")
+            if debug_enabled:
+                logging.debug("Completions before saving:")
+                for c in conv.completions:
+                    logging.debug(
+                        "Completion ID: %s, Index: %s, Content: %s",
+                        c.get("completion_id"), c.get("index"), c.get("content"))
 
             doc = json.loads(conv.serialize())
-            print(f"[DEBUG] SAVING TO DB: {len(doc.get('completions', []))} completions")
-            for i, c in enumerate(doc.get('completions', [])):
-                print(f"[DEBUG]   DB Save completion {i}: Index={c.get('index')}, User={c.get('user_text')}")
+            if debug_enabled:
+                logging.debug("SAVING TO DB: %s completions", len(doc.get("completions", [])))
+                for i, c in enumerate(doc.get("completions", [])):
+                    logging.debug(
+                        "  DB Save completion %s: Index=%s, User=%s",
+                        i, c.get("index"), c.get("user_text"))
             resp = await self.upsert_item(doc)
         return resp
 
     async def load_conversation(self, conv_id: str | None) -> AiConversation | None:
         conv = None
         if conv_id is not None:
+            # the per-completion logging loop only runs when INFO is enabled
+            info_enabled = logging.getLogger().isEnabledFor(logging.INFO)
             self.set_container(ConfigService.conversations_container())
             sql_params = [dict(name="@conversation_id", value=conv_id)]
             sql = "select * from c where c.conversation_id = @conversation_id offset 0 limit 1"
             items = await self.parameterized_query(sql, sql_params, True)
-            print(f"[DEBUG] DB QUERY returned {len(items)} items for conv_id={conv_id}")
+            logging.debug("DB QUERY returned %s items for conv_id=%s", len(items), conv_id)
             for doc in items:
                 completions = doc.get("completions", [])
-                print(f"[DEBUG] RAW DB DOC has {len(completions)} completions")
-                for i, c in enumerate(completions):
-                    print(f"[DEBUG]   Raw DB completion {i}: Index={c.get('index')}, User={c.get('user_text')}")
                 conv = AiConversation(doc)
                 # DEBUGGING: Log what we loaded from database
-                logging.info(f"LOADED FROM DB: {len(completions)} completions for conv_id={conv_id}")
-                for i, c in enumerate(completions):
-                    logging.info(f"  DB completion {i}: ID={c.get('completion_id')}, Index={c.get('index')}, User={c.get('user_text')}")
+                logging.info("LOADED FROM DB: %s completions for conv_id=%s", len(completions), conv_id)
+                if info_enabled:
+                    for i, c in enumerate(completions):
+                        logging.info(
+                            "  DB completion %s: ID=%s, Index=%s, User=%s",
+                            i, c.get("completion_id"), c.get("index"), c.get("user_text"))
         return conv
 
     async def find_library(self, name: str | None) -> dict | None:
@@ -10,7 +10,7 @@ from src.services.cosmos_nosql_service import CosmosNoSQLService
 from src.services.config_service import ConfigService
 from src.services.ontology_service import OntologyService
 from src.services.rag_data_result import RAGDataResult
-from src.services.strategy_builder import StrategyBuilder
+from src.services.strategy_builder import StrategyBuilder, VALID_STRATEGIES
 from src.util.cosmos_doc_filter import CosmosDocFilter
 from src.util.sparql_query_response import SparqlQueryResponse
 from src.util.fs import FS
@@ -23,6 +23,9 @@ from src.util.fs import FS
 #
 # Chris Joakim & Aleksey Savateyev, Microsoft, 2025
 
+# the maximum length of user text or SPARQL included in WARNING log records
+LOGGED_TEXT_MAX_LEN = 256
+
 
 class RAGDataService:
 
@@ -30,6 +33,10 @@ class RAGDataService:
         try:
             self.ai_svc = ai_svc
             self.nosql_svc = nosql_svc
+            # the graph microservice HTTP client is created lazily, on the
+            # event loop, and reused so that its connections are kept alive
+            self.graph_microsvc_client = None
+            self.sparql_query_url = self.graph_microsvc_sparql_query_url()
 
             # web service authentication with shared secrets
             websvc_auth_header = ConfigService.websvc_auth_header()
@@ -60,11 +67,13 @@ class RAGDataService:
         rdr.set_attr("max_doc_count", max_doc_count)
 
         sb = StrategyBuilder(self.ai_svc)
-        strategy_obj = sb.determine(user_text)
+        # determine() may make a blocking AzureOpenAI completion call,
+        # which it skips when given a valid strategy_override
+        strategy_obj = await asyncio.to_thread(sb.determine, user_text, strategy_override)
         # honor explicit user choice when provided and valid; still use name/context from builder
-        valid_choices = {"db", "vector", "graph"}
+        overridden = strategy_override in VALID_STRATEGIES
         strategy = strategy_obj["strategy"]
-        if strategy_override and strategy_override in valid_choices:
+        if overridden:
             strategy = strategy_override
         rdr.add_strategy(strategy)
         rdr.set_context(strategy_obj["name"])
@@ -72,22 +81,56 @@ class RAGDataService:
         if strategy == "db":
             name = strategy_obj["name"]
             rdr.set_attr("name", name)
-            await self.get_database_rag_data(user_text, name, rdr, max_doc_count)
-            if rdr.has_no_docs() and not (strategy_override and strategy_override in valid_choices): #don't fall back if was overridden
-                rdr.add_strategy("vector")
-                await self.get_vector_rag_data(user_text, rdr, max_doc_count)
-
+            primary = self.get_database_rag_data(user_text, name, rdr, max_doc_count)
         elif strategy == "graph":
-            await self.get_graph_rag_data(user_text, rdr, max_doc_count, custom_rules)
-            if rdr.has_no_docs() and not (strategy_override and strategy_override in valid_choices): #don't fall back if was overridden
-                rdr.add_strategy("vector")
-                await self.get_vector_rag_data(user_text, rdr, max_doc_count)
+            primary = self.get_graph_rag_data(user_text, rdr, max_doc_count, custom_rules)
         else:
-            await self.get_vector_rag_data(user_text, rdr, max_doc_count)
+            primary = self.get_vector_rag_data(user_text, rdr, max_doc_count)
+
+        if strategy in ("db", "graph") and not overridden: #don't fall back if was overridden
+            await self.get_rag_data_with_vector_fallback(primary, user_text, rdr, max_doc_count)
+        else:
+            await primary
 
         rdr.finish()
         return rdr
 
+    async def get_rag_data_with_vector_fallback(
+        self, primary, user_text, rdr: RAGDataResult, max_doc_count=10
+    ) -> None:
+        """
+        Await the given primary (db or graph) retrieval coroutine, falling back
+        to the vector search if it yields no docs.  If enabled per
+        ConfigService.speculative_vector_fallback(), the vector search is
+        started alongside the primary retrieval, into a separate RAGDataResult,
+        and cancelled if the primary retrieval yields docs.
+        """
+        if not ConfigService.speculative_vector_fallback():
+            await primary
+            if rdr.has_no_docs():
+                rdr.add_strategy("vector")
+                await self.get_vector_rag_data(user_text, rdr, max_doc_count)
+            return
+
+        fallback_rdr = RAGDataResult()
+        vector_task = asyncio.create_task(
+            self.get_vector_rag_data(user_text, fallback_rdr, max_doc_count)
+        )
+        try:
+            await primary
+        except BaseException:
+            vector_task.cancel()
+            raise
+
+        if rdr.has_docs():
+            vector_task.cancel()
+            await asyncio.wait([vector_task], timeout=0)
+            return
+        rdr.add_strategy("vector")
+        await vector_task
+        for doc in fallback_rdr.get_rag_docs():
+            rdr.add_doc(doc)
+
     async def get_database_rag_data(
         self, user_text: str, name: str, rdr: RAGDataResult, max_doc_count=10
     ) -> None:
@@ -129,8 +172,9 @@ class RAGDataService:
             logging.warning(
                 "RagDataService#get_vector_rag_data, user_text: '{}', max_doc_count: {}".format(user_text, max_doc_count)
             )
-            create_embedding_response = self.ai_svc.generate_embeddings(user_text)
-            embedding = create_embedding_response.data[0].embedding
+            embedding = await asyncio.to_thread(
+                self.ai_svc.generate_embedding_vector, user_text
+            )
             logging.warning(
                 "RagDataService#get_vector_rag_data, embedding length: {}, first 5 values: {}".format(
                     len(embedding), embedding[:5]
@@ -165,18 +209,26 @@ class RAGDataService:
         self, user_text, rdr: RAGDataResult, max_doc_count=10, custom_rules: Optional[str] = None
     ) -> None:
         try:
+            # WARNING is emitted at the shipped log level, so bound the payload
             logging.warning(
-                "RagDataService#get_graph_rag_data, user_text: {}".format(user_text)
+                "RagDataService#get_graph_rag_data, user_text: %s",
+                str(user_text)[:LOGGED_TEXT_MAX_LEN],
             )
             # first generate and execute the SPARQL query vs the in-memory RDF graph
             info = dict()
             info["natural_language"] = user_text
-            info["owl"] = OntologyService().get_owl_content()
-            # Use custom rules if provided
-            result = self.ai_svc.generate_sparql_from_user_prompt(info, custom_rules)
+            info["owl"] = OntologyService.get_owl_content()
+            # Use custom rules if provided.
+            # The AzureOpenAI completion is a blocking call; run it in a worker
+            # thread so the event loop keeps serving other requests meanwhile.
+            result = await asyncio.to_thread(
+                self.ai_svc.generate_sparql_from_user_prompt, info, custom_rules
+            )
             sparql = result.sparql if result.sparql else ""
             rdr.set_sparql(sparql)
-            logging.warning("get_graph_rag_data - sparql:\n{}".format(sparql))
+            # log a bounded prefix of the generated query; the full text only at DEBUG
+            logging.warning("get_graph_rag_data - sparql:\n%s", sparql[:LOGGED_TEXT_MAX_LEN])
+            logging.debug("get_graph_rag_data - full sparql:\n%s", sparql)
 
             # HTTP POST to the graph microservice to execute the generated SPARQL query
             sqr: SparqlQueryResponse | None = await self.post_sparql_to_graph_microsvc(sparql)
@@ -207,25 +259,35 @@ class RAGDataService:
         """
         sqr = None
         try:
-            url = self.graph_microsvc_sparql_query_url()
             postdata = dict()
             postdata["sparql"] = sparql
-            
-            async with httpx.AsyncClient() as client:
-                r = await client.post(
-                    url,
-                    headers=self.websvc_headers,
-                    content=json.dumps(postdata),
-                )
-                sqr = SparqlQueryResponse(r)
-                sqr.parse()
-                    
+
+            r = await self.get_graph_microsvc_client().post(
+                self.sparql_query_url,
+                headers=self.websvc_headers,
+                content=json.dumps(postdata),
+            )
+            sqr = SparqlQueryResponse(r)
+            sqr.parse()
+
         except Exception as e:
             logging.error(f"Graph microservice error: {str(e)}")
             logging.exception(e, stack_info=True, exc_info=True)
                 
         return sqr
 
+    def get_graph_microsvc_client(self) -> httpx.AsyncClient:
+        """Return the shared httpx.AsyncClient, creating it on first use."""
+        if self.graph_microsvc_client is None or self.graph_microsvc_client.is_closed:
+            self.graph_microsvc_client = httpx.AsyncClient()
+        return self.graph_microsvc_client
+
+    async def close(self):
+        if self.graph_microsvc_client is not None:
+            await self.graph_microsvc_client.aclose()
+            self.graph_microsvc_client = None
+            logging.info("RAGDataService - graph microservice client closed")
+
     def graph_microsvc_sparql_query_url(self):
         return "{}:{}/sparql_query".format(
             ConfigService.graph_service_url(), ConfigService.graph_service_port()
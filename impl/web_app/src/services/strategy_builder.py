@@ -1,5 +1,8 @@
 import asyncio
 import logging
+import threading
+
+from collections import OrderedDict
 
 from src.services.ai_service import AiService
 from src.services.entities_service import EntitiesService
@@ -13,14 +16,33 @@ from src.services.entities_service import EntitiesService
 #
 # Aleksey Savateyev & Chris Joakim, Microsoft, 2025
 
+# constant sets, built once at import time rather than per call
+VALID_STRATEGIES = frozenset(("db", "vector", "graph"))
+DB_STRATEGY_NAMES = frozenset(("database", "db", "dbms"))
+LOOKUP_WORDS = frozenset(
+    ("lookup", "find", "fetch", "search", "get", "retrieve", "show")
+)
+
 
 class StrategyBuilder:
     """Constructor method; call initialize() immediately after this."""
 
+    # LRU cache of the LLM-determined strategies, keyed by the normalized
+    # natural language (see llm_strategy_cache_key), shared by all instances
+    # so repeated questions skip the completion call
+    llm_strategy_cache = OrderedDict()
+    llm_strategy_cache_max_size = 1024
+    llm_strategy_cache_lock = threading.Lock()
+
     def __init__(self, ai_svc: AiService):
         self.ai_svc = ai_svc
 
-    def determine(self, natural_language) -> dict:
+    def determine(self, natural_language, strategy_override: str | None = None) -> dict:
+        """
+        Return a strategy dict for the given natural language.  If a valid
+        strategy_override is given, the LLM classification is skipped since
+        its result would be discarded; the entity name is still identified.
+        """
         strategy = {
             "natural_language": natural_language,
             "strategy": "",
@@ -48,6 +70,21 @@ class StrategyBuilder:
         except Exception:
             strategy["name"] = ""
 
+        if strategy_override in VALID_STRATEGIES:
+            strategy["strategy"] = strategy_override
+            strategy["algorithm"] = "override"
+            return strategy
+
+        cached_strategy = self.cached_llm_strategy(natural_language)
+        if cached_strategy is not None:
+            strategy["strategy"] = cached_strategy
+            strategy["algorithm"] = "llm"
+            logging.info(
+                "StrategyBuilder:determine got cached strategy: %s from %s",
+                cached_strategy, user_prompt
+            )
+            return strategy
+
         try:
             system_prompt = (
                 "You are helping to determine the data source to use while fetching context "
@@ -62,8 +99,13 @@ class StrategyBuilder:
                 "Classify the data source with one word: db, vector, or graph."
             )
             raw = self.ai_svc.get_completion(natural_language, system_prompt)
-            strategy["strategy"] = self._normalize_strategy_output(raw)
+            resolved = self._resolve_strategy_output(raw)
+            strategy["strategy"] = resolved or "vector"
             strategy["algorithm"] = "llm"
+            # only cache real answers; an empty or unrecognized completion
+            # (e.g. a content-filter result) falls back to vector uncached
+            if resolved is not None:
+                self.cache_llm_strategy(natural_language, resolved)
             logging.info(
                 "StrategyBuilder:determine got strategy: {} from {}".format(
                     strategy["strategy"], user_prompt
@@ -77,12 +119,46 @@ class StrategyBuilder:
             )
         return strategy
 
+    @classmethod
+    def llm_strategy_cache_key(cls, natural_language) -> str:
+        """
+        Return the cache key for the given text; case and whitespace
+        differences don't change the strategy so they map to the same key.
+        """
+        return " ".join(str(natural_language).lower().split())
+
+    @classmethod
+    def cached_llm_strategy(cls, natural_language) -> str | None:
+        """Return the cached LLM strategy for the given text, or None."""
+        key = cls.llm_strategy_cache_key(natural_language)
+        with cls.llm_strategy_cache_lock:
+            if key in cls.llm_strategy_cache:
+                cls.llm_strategy_cache.move_to_end(key)
+                return cls.llm_strategy_cache[key]
+        return None
+
+    @classmethod
+    def cache_llm_strategy(cls, natural_language, strategy: str) -> None:
+        """Cache the LLM strategy for the given text, evicting the oldest entries."""
+        key = cls.llm_strategy_cache_key(natural_language)
+        with cls.llm_strategy_cache_lock:
+            cls.llm_strategy_cache[key] = strategy
+            cls.llm_strategy_cache.move_to_end(key)
+            while len(cls.llm_strategy_cache) > cls.llm_strategy_cache_max_size:
+                cls.llm_strategy_cache.popitem(last=False)
+
     def _normalize_strategy_output(self, raw) -> str:
         """Normalize LLM output to one of 'db', 'vector', or 'graph'."""
+        return self._resolve_strategy_output(raw) or "vector"
+
+    def _resolve_strategy_output(self, raw) -> str | None:
+        """
+        Map LLM output to one of 'db', 'vector', or 'graph', or return None
+        if the output doesn't identify a strategy.
+        """
         try:
-            valid = {"db", "vector", "graph"}
             if raw is None:
-                return "vector"
+                return None
             text = str(raw).strip().lower()
             # Attempt JSON parse if looks like JSON
             if (text.startswith("{") and text.endswith("}")) or (text.startswith("[") and text.endswith("]")):
@@ -101,9 +177,9 @@ class StrategyBuilder:
                     # fall back to plain text handling
                     pass
             # Map common variants
-            if text in ("database", "db", "dbms"):
+            if text in DB_STRATEGY_NAMES:
                 return "db"
-            if text in valid:
+            if text in VALID_STRATEGIES:
                 return text
             # Heuristic containment
             if "graph" in text:
@@ -112,10 +188,10 @@ class StrategyBuilder:
                 return "vector"
             if "db" in text or "database" in text or "sql" in text or "lookup" in text or "find" in text or "fetch" in text:
                 return "db"
-            # Default safe choice
-            return "vector"
+            # No recognizable strategy
+            return None
         except Exception:
-            return "vector"
+            return None
 
     def check_for_simple_known_utterances(self, strategy):
         """
@@ -125,8 +201,7 @@ class StrategyBuilder:
             nl_words = strategy["natural_language"].split(" ")
             if len(nl_words) < 4:
                 # examples: 'lookup python Flask' or 'find library Flask'
-                lookup_words = "lookup,find,fetch,search,get,retrieve,show".split(",")
-                if nl_words[0].lower() in lookup_words:
+                if nl_words[0].lower() in LOOKUP_WORDS:
                     for word in nl_words[1:]:
                         if EntitiesService.entity_present(word):
                             strategy["strategy"] = "db"
@@ -7,11 +7,21 @@
 
 
 import logging
+import os
 
 from src.util.fs import FS
 from src.services.config_service import ConfigService
 
 class Prompts:
+
+    # The generated SPARQL system prompts keyed by custom_rules, each held as a
+    # ((path, mtime, owl) stamp, prompt) tuple.  The dict is never mutated in
+    # place; a new dict replaces it in one assignment, so threads reading it
+    # concurrently never see a stamp paired with another entry's prompt.
+    # See generate_sparql_system_prompt()
+    sparql_prompt_cache = dict()
+    sparql_prompt_cache_max_size = 16
+
     def __init__(self, opts={}):
         self.opts = opts
 
@@ -23,9 +33,23 @@ class Prompts:
             logging.warning(f"PROMPTS.PY - custom_rules type: {type(custom_rules)}")
             logging.warning("=" * 80)
             
-            # Force fresh file read on every call - no caching
-            import os
+            # The prompt file is checked on every call so that edits take effect
+            # without a restart, but the prompt is only rebuilt when the file,
+            # the ontology or the custom rules have changed.  Prompts read from
+            # a URL have no modification time and are always rebuilt.
             prompt_path = ConfigService.prompt_sparql()
+            prompt_stamp = None
+            if os.path.isfile(prompt_path):
+                prompt_stamp = (
+                    os.path.abspath(prompt_path),
+                    os.stat(prompt_path).st_mtime_ns,
+                    minimized_owl,
+                )
+                cached = Prompts.sparql_prompt_cache.get(custom_rules)
+                if cached is not None and cached[0] == prompt_stamp:
+                    logging.info("Reusing SPARQL prompt built from: %s", prompt_stamp[0])
+                    return cached[1]
+
             logging.info(f"Loading SPARQL prompt from: {os.path.abspath(prompt_path)}")
             template = FS.read(prompt_path)
             if template is None:
@@ -58,7 +82,15 @@ class Prompts:
             # Restore the single {} for the ontology placeholder (now it's {{{{}}}} after doubling)
             safe_prompt = safe_prompt.replace("{{{{}}}}", "{}")
             
-            return safe_prompt.format(minimized_owl)
+            prompt = safe_prompt.format(minimized_owl)
+            if prompt_stamp is not None:
+                cache = dict(Prompts.sparql_prompt_cache)
+                cache.pop(custom_rules, None)
+                cache[custom_rules] = (prompt_stamp, prompt)
+                while len(cache) > Prompts.sparql_prompt_cache_max_size:
+                    cache.pop(next(iter(cache)))
+                Prompts.sparql_prompt_cache = cache
+            return prompt
         except Exception as e:
             logging.critical(
                 "Exception in generate_sparql_system_prompt: {}".format(str(e))
@@ -68,11 +68,13 @@ class SparqlQueryResponse:
     def binding_values_for(self, binding_var_names: list):
         values = list()
         try:
-            for binding in self.query_results_obj.get("results", {}).get("bindings", []):
-                row_values = dict()
-                for var_name in binding_var_names:
-                    row_values[var_name] = binding.get(var_name, {}).get("value")
-                values.append(row_values)
+            # hoist the bindings lookup; build the rows with comprehensions
+            # since the result set can have thousands of bindings
+            bindings = self.query_results_obj.get("results", {}).get("bindings", [])
+            values = [
+                {var_name: binding.get(var_name, {}).get("value") for var_name in binding_var_names}
+                for binding in bindings
+            ]
         except Exception as e:
             logging.critical((str(e)))
             logging.exception(e, stack_info=True, exc_info=True)
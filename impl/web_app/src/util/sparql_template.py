@@ -10,12 +10,20 @@ import psutil
 
 class SparqlTemplate:
 
+    # jinja2 Environments keyed by directory, shared across instances so
+    # the compiled templates are cached rather than rebuilt per render
+    jinja2_envs = dict()
+
     def __init__(self, opts={}):
         self.opts = opts
 
     def render(self, template_name: str, values: dict):
         cwd = psutil.Process().cwd()
-        env = jinja2.Environment(loader=jinja2.FileSystemLoader(cwd), autoescape=True)
+        if cwd not in SparqlTemplate.jinja2_envs:
+            SparqlTemplate.jinja2_envs[cwd] = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(cwd), autoescape=True
+            )
+        env = SparqlTemplate.jinja2_envs[cwd]
         template_path = f"sparql/{template_name}"
         t = env.get_template(template_path)
         return t.render(values)
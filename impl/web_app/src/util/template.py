@@ -12,6 +12,10 @@ class Template:
     This class is used to create text content using jinja2 templates.
     """
 
+    # jinja2 Environments keyed by root_dir; reusing an Environment lets
+    # its template cache skip re-parsing and re-compiling the templates
+    jinja2_envs = dict()
+
     @classmethod
     def get_template(cls, root_dir: str, name):
         """
@@ -28,9 +32,11 @@ class Template:
     @classmethod
     def _get_jinja2_env(cls, root_dir: str):
         """
-        Private method to return a jinja2 Environment object for the
-        given root_dir.
+        Private method to return the cached jinja2 Environment object
+        for the given root_dir, creating it on first use.
         """
-        return jinja2.Environment(
-            loader=jinja2.FileSystemLoader(root_dir), autoescape=True
-        )
+        if root_dir not in cls.jinja2_envs:
+            cls.jinja2_envs[root_dir] = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(root_dir), autoescape=True
+            )
+        return cls.jinja2_envs[root_dir]
@@ -81,3 +81,61 @@ async def test_generate_embeddings():
     assert resp is not None
     assert "CreateEmbeddingResponse" in str(type(resp))
     assert len(resp.data[0].embedding) == 1536
+
+
+class SimulatedEmbedding:
+    # This class simulates an item of CreateEmbeddingResponse.data
+    def __init__(self, embedding):
+        self.embedding = embedding
+
+
+class SimulatedEmbeddingResponse:
+    # This class simulates a CreateEmbeddingResponse
+    def __init__(self, embedding):
+        self.data = [SimulatedEmbedding(embedding)]
+
+
+class CountingEmbeddings:
+    # This class simulates the embeddings attribute of an AzureOpenAI client
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, input, model):
+        self.calls = self.calls + 1
+        return SimulatedEmbeddingResponse([0.25, -0.5, float(len(input))])
+
+
+class SimulatedAoaiClient:
+    def __init__(self):
+        self.embeddings = CountingEmbeddings()
+
+
+def test_generate_embedding_vector_cache():
+    AiService.embeddings_cache.clear()
+    ai_svc = AiService.__new__(AiService)
+    ai_svc.aoai_client = SimulatedAoaiClient()
+    ai_svc.embeddings_deployment = "embeddings"
+
+    vector1 = ai_svc.generate_embedding_vector("python web frameworks")
+    vector2 = ai_svc.generate_embedding_vector("python web frameworks")
+    assert vector1 == [0.25, -0.5, 21.0]
+    assert vector2 == vector1
+    assert ai_svc.aoai_client.embeddings.calls == 1
+
+    # generate_embeddings still returns the response object, uncached
+    resp = ai_svc.generate_embeddings("python web frameworks")
+    assert resp.data[0].embedding == vector1
+    assert ai_svc.aoai_client.embeddings.calls == 2
+
+    ai_svc.generate_embedding_vector("python testing libraries")
+    assert ai_svc.aoai_client.embeddings.calls == 3
+    AiService.embeddings_cache.clear()
+
+
+def test_shared_aoai_client():
+    endpoint = "https://example.openai.azure.com/"
+    c1 = AiService.shared_aoai_client(endpoint, "key1", "2024-06-01")
+    c2 = AiService.shared_aoai_client(endpoint, "key1", "2024-06-01")
+    c3 = AiService.shared_aoai_client(endpoint, "key2", "2024-06-01")
+    assert c1 is c2
+    assert c1 is not c3
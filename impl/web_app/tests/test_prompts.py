@@ -1,3 +1,5 @@
+import os
+
 from src.util.prompts import Prompts
 from src.util.fs import FS
 
@@ -24,6 +26,44 @@ def test_generate_sparql_system_prompt():
         assert literal in ptext
 
 
+def test_generate_sparql_system_prompt_reuse(tmp_path, monkeypatch):
+    prompt_file = tmp_path / "gen_sparql_test.txt"
+    prompt_file.write_text(
+        "Generate SPARQL.{custom_rules}\nOntology:\n{{}}\n", encoding="utf-8"
+    )
+    monkeypatch.setenv("CAIG_PROMPT_SPARQL_PATH", str(prompt_file))
+
+    Prompts.sparql_prompt_cache = dict()
+    p = Prompts()
+    ptext1 = p.generate_sparql_system_prompt(sample_owl())
+    ptext2 = p.generate_sparql_system_prompt(sample_owl())
+    assert '<owl:Class rdf:ID="Library">' in ptext1
+    assert ptext2 is ptext1
+
+    # different custom rules produce a different prompt
+    ptext3 = p.generate_sparql_system_prompt(sample_owl(), "Always add LIMIT 10")
+    assert "Always add LIMIT 10" in ptext3
+    assert "Always add LIMIT 10" not in ptext1
+
+    # editing the prompt file takes effect without a restart
+    prompt_file.write_text("Edited prompt.{custom_rules}\n{{}}\n", encoding="utf-8")
+    stat = os.stat(prompt_file)
+    os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    ptext4 = p.generate_sparql_system_prompt(sample_owl())
+    assert ptext4.startswith("Edited prompt.")
+
+    # prompts are cached per custom rules, so alternating callers with and
+    # without rules keep reusing their own prompts
+    ptext5 = p.generate_sparql_system_prompt(sample_owl(), "Always add LIMIT 10")
+    ptext6 = p.generate_sparql_system_prompt(sample_owl(), "Always add LIMIT 10")
+    assert ptext6 is ptext5
+    assert p.generate_sparql_system_prompt(sample_owl()) is ptext4
+
+    stamp, cached_prompt = Prompts.sparql_prompt_cache[None]
+    assert stamp[0] == os.path.abspath(prompt_file)
+    assert cached_prompt is ptext4
+
+
 def sample_owl():
     return """
 <?xml version="1.0"?>
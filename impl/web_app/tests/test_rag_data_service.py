@@ -1,4 +1,6 @@
+import asyncio
 import json
+import time
 import pytest
 
 from src.services.ai_completion import AiCompletion
@@ -131,3 +133,100 @@ LIMIT 6
     sqr: SparqlQueryResponse = await rds.post_sparql_to_graph_microsvc(sparql)
     FS.write_json(sqr.response_obj, "tmp/sample_post_sparql_flask_query.json")
     assert len(sqr.binding_values()) == 6
+
+
+class CountingEmbeddingAiService:
+    # This class simulates AiService#generate_embedding_vector, a blocking call
+    def __init__(self):
+        self.embedding_calls = 0
+
+    def generate_embedding_vector(self, text):
+        self.embedding_calls = self.embedding_calls + 1
+        time.sleep(0.02)
+        return [0.1, 0.2, 0.3]
+
+
+class SimulatedVectorNoSQLService:
+    # This class simulates the CosmosNoSQLService vector search
+    def __init__(self):
+        self.vector_search_calls = 0
+
+    def set_db(self, dbname):
+        pass
+
+    def set_container(self, cname):
+        pass
+
+    async def vector_search(self, **kwargs):
+        self.vector_search_calls = self.vector_search_calls + 1
+        await asyncio.sleep(0.01)
+        return [{"name": "vector_doc", "embedding": [0.1, 0.2, 0.3], "_score": 0.9}]
+
+
+def simulated_rag_data_service():
+    ConfigService.set_standard_unit_test_env_vars()
+    return RAGDataService(CountingEmbeddingAiService(), SimulatedVectorNoSQLService())
+
+
+async def fallback_rdr_for(rds, primary_docs):
+    rdr = RAGDataResult()
+
+    async def primary():
+        # a real primary awaits a Cosmos DB or graph microservice round-trip
+        await asyncio.sleep(0.05)
+        for doc in primary_docs:
+            rdr.add_doc(doc)
+
+    await rds.get_rag_data_with_vector_fallback(primary(), "flask", rdr)
+    await asyncio.sleep(0.05)
+    return rdr
+
+
+@pytest.mark.asyncio
+async def test_vector_fallback_is_serial_by_default(monkeypatch):
+    monkeypatch.delenv("CAIG_SPECULATIVE_VECTOR_FALLBACK", raising=False)
+    rds = simulated_rag_data_service()
+
+    rdr = await fallback_rdr_for(rds, [{"name": "db_doc"}])
+    assert rds.ai_svc.embedding_calls == 0
+    assert rds.nosql_svc.vector_search_calls == 0
+    assert rdr.get_strategy() == ""
+    assert rdr.get_rag_docs() == [{"name": "db_doc"}]
+
+    rdr = await fallback_rdr_for(rds, [])
+    assert rds.ai_svc.embedding_calls == 1
+    assert rds.nosql_svc.vector_search_calls == 1
+    assert rdr.get_strategy() == "vector"
+    assert rdr.get_rag_docs() == [{"name": "vector_doc"}]
+
+
+@pytest.mark.asyncio
+async def test_speculative_vector_fallback(monkeypatch):
+    monkeypatch.setenv("CAIG_SPECULATIVE_VECTOR_FALLBACK", "true")
+    rds = simulated_rag_data_service()
+
+    # the speculative embeddings call is made even when the primary hits;
+    # that's the cost of the opt-in, but its docs are not used
+    rdr = await fallback_rdr_for(rds, [{"name": "db_doc"}])
+    assert rds.ai_svc.embedding_calls == 1
+    assert rdr.get_strategy() == ""
+    assert rdr.get_rag_docs() == [{"name": "db_doc"}]
+
+    rdr = await fallback_rdr_for(rds, [])
+    assert rds.ai_svc.embedding_calls == 2
+    assert rdr.get_strategy() == "vector"
+    assert rdr.get_rag_docs() == [{"name": "vector_doc"}]
+
+
+@pytest.mark.asyncio
+async def test_graph_microsvc_client_is_reused():
+    ConfigService.set_standard_unit_test_env_vars()
+    rds = RAGDataService(None, None)
+    assert rds.sparql_query_url.endswith("/sparql_query")
+
+    client = rds.get_graph_microsvc_client()
+    assert rds.get_graph_microsvc_client() is client
+    await rds.close()
+    assert client.is_closed
+    assert rds.get_graph_microsvc_client() is not client
+    await rds.close()
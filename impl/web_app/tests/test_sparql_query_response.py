@@ -156,6 +156,38 @@ def test_flask_query():
     ]
 
 
+def test_binding_values_for_inline_response():
+    obj = {
+        "results": {
+            "head": {"vars": ["s", "o"]},
+            "results": {
+                "bindings": [
+                    {
+                        "s": {"type": "uri", "value": "http://cosmosdb.com/caig#flask"},
+                        "o": {"type": "uri", "value": "http://cosmosdb.com/caig#click"},
+                    },
+                    {
+                        "s": {"type": "uri", "value": "http://cosmosdb.com/caig#flask"},
+                    },
+                ]
+            },
+        }
+    }
+    sqr = SparqlQueryResponse(SimulatedHttpxResponse(json.dumps(obj)))
+    sqr.parse()
+
+    assert sqr.parse_error == False
+    assert sqr.count == 2
+    assert sqr.binding_values() == [
+        {"s": "http://cosmosdb.com/caig#flask", "o": "http://cosmosdb.com/caig#click"},
+        {"s": "http://cosmosdb.com/caig#flask", "o": None},
+    ]
+    assert sqr.binding_values_for(["o"]) == [
+        {"o": "http://cosmosdb.com/caig#click"},
+        {"o": None},
+    ]
+
+
 def simulated_response(infile):
     obj = FS.read_json(infile)
     r = SimulatedHttpxResponse(json.dumps(obj))
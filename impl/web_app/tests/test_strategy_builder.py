@@ -61,3 +61,90 @@ async def test_determine_with_llm_cases():
     assert len(examples_list) > 10
     assert tested_examples_count > 0
     assert tested_examples_count == success_count
+
+
+def test_normalize_strategy_output():
+    sb = StrategyBuilder(None)
+    assert sb._normalize_strategy_output(None) == "vector"
+    assert sb._normalize_strategy_output(" DB ") == "db"
+    assert sb._normalize_strategy_output("Database") == "db"
+    assert sb._normalize_strategy_output('{"source": "graph"}') == "graph"
+    assert sb._normalize_strategy_output("use the knowledge graph") == "graph"
+    assert sb._normalize_strategy_output("an embedding search") == "vector"
+    assert sb._normalize_strategy_output("a SQL lookup") == "db"
+    assert sb._normalize_strategy_output("fetch the record") == "db"
+    assert sb._normalize_strategy_output("unclear") == "vector"
+
+
+class CountingAiService:
+    # This class simulates the AiService#get_completion method
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def get_completion(self, user_prompt, system_prompt):
+        self.calls = self.calls + 1
+        return self.response
+
+
+def test_determine_caches_llm_strategy():
+    StrategyBuilder.llm_strategy_cache.clear()
+    ai_svc = CountingAiService('{"source": "graph"}')
+    sb = StrategyBuilder(ai_svc)
+    text = "what are the dependencies of the dependencies of flask"
+
+    strategy_obj1 = sb.determine(text)
+    strategy_obj2 = StrategyBuilder(ai_svc).determine(text)
+    assert strategy_obj1["strategy"] == "graph"
+    assert strategy_obj2["strategy"] == "graph"
+    assert strategy_obj2["algorithm"] == "llm"
+    assert ai_svc.calls == 1
+
+    # case and whitespace variants of the same question share the entry
+    strategy_obj3 = sb.determine(
+        "  What are the dependencies of the\tdependencies of Flask "
+    )
+    assert strategy_obj3["strategy"] == "graph"
+    assert ai_svc.calls == 1
+
+    StrategyBuilder.llm_strategy_cache.clear()
+
+
+def test_determine_does_not_cache_default_fallback():
+    StrategyBuilder.llm_strategy_cache.clear()
+    text = "what are the dependencies of flask"
+    for response in [None, "", "I cannot answer that"]:
+        ai_svc = CountingAiService(response)
+        sb = StrategyBuilder(ai_svc)
+        strategy_obj1 = sb.determine(text)
+        strategy_obj2 = sb.determine(text)
+        assert strategy_obj1["strategy"] == "vector"
+        assert strategy_obj2["strategy"] == "vector"
+        assert ai_svc.calls == 2
+    assert len(StrategyBuilder.llm_strategy_cache) == 0
+
+    # a later usable answer is then cached
+    ai_svc = CountingAiService("graph")
+    assert StrategyBuilder(ai_svc).determine(text)["strategy"] == "graph"
+    assert StrategyBuilder(ai_svc).determine(text)["strategy"] == "graph"
+    assert ai_svc.calls == 1
+    StrategyBuilder.llm_strategy_cache.clear()
+
+
+def test_determine_with_strategy_override_skips_llm():
+    StrategyBuilder.llm_strategy_cache.clear()
+    ai_svc = CountingAiService("vector")
+    sb = StrategyBuilder(ai_svc)
+
+    strategy_obj = sb.determine("what are the dependencies of flask", "graph")
+    assert strategy_obj["strategy"] == "graph"
+    assert strategy_obj["algorithm"] == "override"
+    assert ai_svc.calls == 0
+
+    # an invalid override is ignored
+    strategy_obj = sb.determine("what are the dependencies of flask", "bogus")
+    assert strategy_obj["strategy"] == "vector"
+    assert strategy_obj["algorithm"] == "llm"
+    assert ai_svc.calls == 1
+
+    StrategyBuilder.llm_strategy_cache.clear()
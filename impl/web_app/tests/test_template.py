@@ -22,6 +22,18 @@ def test_get_template_and_render():
     assert text.strip() == expected_content()
 
 
+def test_jinja2_env_is_reused_per_root_dir(tmp_path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    (templates_dir / "hello.txt").write_text("hello {{ name }}")
+
+    t1 = Template.get_template(str(tmp_path), "hello.txt")
+    t2 = Template.get_template(str(tmp_path), "hello.txt")
+    assert Template._get_jinja2_env(str(tmp_path)) is t1.environment
+    assert t1 is t2
+    assert Template.render(t2, {"name": "caig"}) == "hello caig"
+
+
 def expected_content():
     return """
 <?xml version="1.0"?>
@@ -131,6 +131,7 @@ async def lifespan(app: FastAPI):
     yield
 
     logging.info("FastAPI lifespan, shutting down...")
+    await rag_data_svc.close()
     await nosql_svc.close()
     logging.info("FastAPI lifespan, pool closed")
 
@@ -358,7 +359,8 @@ async def verify_rules(req: Request):
                     evaluation_prompt = rule_eval_template.format(rule_text, context)
                     
                     # Get LLM response using the aoai_client directly
-                    completion = ai_svc.aoai_client.chat.completions.create(
+                    completion = await asyncio.to_thread(
+                        ai_svc.aoai_client.chat.completions.create,
                         model=ai_svc.completions_deployment,
                         temperature=0.0,
                         messages=[
@@ -525,7 +527,9 @@ async def ai_post_gen_sparql(req: Request):
     resp_obj["error"] = ""
 
     try:
-        result = ai_svc.generate_sparql_from_user_prompt(resp_obj, custom_rules)
+        result = await asyncio.to_thread(
+            ai_svc.generate_sparql_from_user_prompt, resp_obj, custom_rules
+        )
         sparql = result.sparql if result.sparql else ""
         view_data["sparql"] = SparqlFormatter().pretty(sparql)
         # Update resp_obj with result values
@@ -707,7 +711,7 @@ async def post_vector_search_console(req: Request):
             # RRF search - need both vector and text
             try:
                 logging.info("vectorize: {}".format(text))
-                ai_svc_resp = ai_svc.generate_embeddings(text)
+                ai_svc_resp = await asyncio.to_thread(ai_svc.generate_embeddings, text)
                 vector = ai_svc_resp.data[0].embedding
                 view_data["embedding_message"] = "Embedding from Text"
                 # Truncate embedding display to avoid ERR_RESPONSE_HEADERS_TOO_BIG
@@ -725,7 +729,7 @@ async def post_vector_search_console(req: Request):
             # Vector search (default)
             try:
                 logging.info("vectorize: {}".format(text))
-                ai_svc_resp = ai_svc.generate_embeddings(text)
+                ai_svc_resp = await asyncio.to_thread(ai_svc.generate_embeddings, text)
                 if ai_svc_resp is None or not hasattr(ai_svc_resp, 'data') or len(ai_svc_resp.data) == 0:
                     raise ValueError("Failed to generate embeddings - empty response from AI service")
                 vector = ai_svc_resp.data[0].embedding